@@ -0,0 +1,136 @@
+# cython: language_level=3
+"""
+Compiled J&K statement line scanner.
+
+Build it in place with `cythonize -i jk_lines.pyx`. main_parser imports the built
+extension when present and falls back to main_parser._scan_jk_lines otherwise. Both implement the same state machine; keep them
+in step. The regex checks of the Python version are replaced by character loops here.
+"""
+
+
+cdef inline bint _all_decimal(str s, Py_ssize_t start, Py_ssize_t end):
+    cdef Py_ssize_t i
+    cdef Py_UCS4 c
+    for i in range(start, end):
+        c = s[i]
+        if not c.isdecimal():
+            return False
+    return True
+
+
+cdef bint _is_ddmmyyyy(str s):
+    # DD/MM/YYYY prefix
+    return (len(s) >= 10 and s[2] == u'/' and s[5] == u'/'
+            and _all_decimal(s, 0, 2) and _all_decimal(s, 3, 5) and _all_decimal(s, 6, 10))
+
+
+cdef bint _is_cheque(str s):
+    # ^\d{6}$
+    return len(s) == 6 and _all_decimal(s, 0, 6)
+
+
+cdef bint _is_amount(str s):
+    # ^-?[\d,]+(\.\d+)?$
+    cdef Py_ssize_t n = len(s)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t start
+    cdef Py_UCS4 c
+    if n and s[0] == u'-':
+        i = 1
+    start = i
+    while i < n:
+        c = s[i]
+        if c != u',' and not c.isdecimal():
+            break
+        i += 1
+    if i == start:
+        return False
+    if i == n:
+        return True
+    if s[i] != u'.':
+        return False
+    i += 1
+    return i < n and _all_decimal(s, i, n)
+
+
+def scan_jk_lines(list lines, start_keywords, skip_markers):
+    """
+    Scans J&K statement lines (all pages, in document order) into transaction tuples.
+
+    Args:
+        lines (list): Raw text lines
+        start_keywords: Prefixes (case-insensitive) that open the next transaction's description
+        skip_markers: Substrings marking header/footer lines
+
+    Returns:
+        list: (date, description, ref_no, debit, credit, balance, cheque) tuples
+    """
+    cdef list rows = []
+    cdef list parts, rem_parts
+    cdef tuple start_upper = tuple(kw.upper() for kw in start_keywords)
+    cdef tuple markers = tuple(skip_markers)
+    cdef str raw, line, marker, val_date, txn_date, remaining, current_desc
+    cdef str cheque_no, ref_no, balance, deposit, withdrawal
+    cdef str pending = u""
+    cdef bint skip
+
+    for raw in lines:
+        line = raw.strip()
+        if not line:
+            continue
+
+        # Skip header lines
+        skip = False
+        for marker in markers:
+            if marker in line:
+                skip = True
+                break
+        if skip:
+            continue
+
+        # New transaction
+        if _is_ddmmyyyy(line):
+            parts = line.split()
+            if len(parts) < 3:
+                continue
+
+            val_date = parts[0]
+            txn_date = parts[1] if _is_ddmmyyyy(parts[1]) else u""
+
+            remaining = line.replace(val_date, u"", 1).replace(txn_date, u"", 1).strip()
+            rem_parts = remaining.split()
+
+            cheque_no = u""
+            ref_no = u""
+            balance = deposit = withdrawal = u"0.0"
+
+            if rem_parts:
+                if _is_cheque(rem_parts[0]):
+                    cheque_no = rem_parts.pop(0)
+                elif rem_parts[0] == u"-":
+                    rem_parts.pop(0)
+
+            if rem_parts:
+                ref_no = rem_parts.pop()
+            if rem_parts and _is_amount(rem_parts[-1]):
+                balance = rem_parts.pop()
+            if rem_parts and _is_amount(rem_parts[-1]):
+                deposit = rem_parts.pop()
+            if rem_parts and _is_amount(rem_parts[-1]):
+                withdrawal = rem_parts.pop()
+
+            current_desc = u" ".join(rem_parts)
+            if pending:
+                current_desc = pending + u" " + current_desc
+                pending = u""
+
+            # Description fragments stay in a list until the scan ends
+            rows.append([val_date, [current_desc], ref_no, withdrawal, deposit, balance, cheque_no])
+
+        # Multi-line descriptions
+        elif line.upper().startswith(start_upper):
+            pending = (pending + u" " + line).strip()
+        elif rows:
+            (<list>(<list>rows[-1])[1]).append(line)
+
+    return [(row[0], u" ".join(row[1]), row[2], row[3], row[4], row[5], row[6]) for row in rows]
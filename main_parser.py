@@ -4,8 +4,30 @@ import json
 import re
 import argparse
 import logging
+import multiprocessing
+import shlex
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import pdfplumber
 
+# Optional: orjson serializes the output several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: NumPy sorts HDFC words into rows in one vectorized pass
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: compiled J&K line scanner, built once from jk_lines.pyx (see README)
+try:
+    import jk_lines
+except ImportError:
+    jk_lines = None
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -13,6 +35,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+
+
 # ==========================================
 # CONSTANTS & PATTERNS
 # ==========================================
@@ -23,6 +48,11 @@ JK_START_KEYWORDS = [
     "IMPS", "ACH", "BPAY", "MB:", "Dr Card", "eTFR", "REJECT",
     "By Inst", "Cheque", "To Clg", "Int. Pd", "Pos", "CMS", "TRF"
 ]
+JK_START_RE = re.compile(r'^(?:' + '|'.join(re.escape(kw) for kw in JK_START_KEYWORDS) + r')', re.IGNORECASE)
+# Header/footer markers; lines containing any of them are skipped
+JK_SKIP_MARKERS = ("Value Date", "Account Balance", "Page", "Balance Carried")
+JK_AMOUNT_RE = re.compile(r'^-?[\d,]+(\.\d+)?$')
+JK_CHEQUE_RE = re.compile(r'^\d{6}$')
 
 # --- HDFC Bank Constants ---
 HDFC_JUNK_PHRASES = [
@@ -47,17 +77,62 @@ HDFC_REF_BLOCKLIST = [
     "m/s", "rtgs", "neft"
 ]
 
+# --- HDFC Bank Regex ---
+HDFC_RE_AMOUNT_SIMPLE = re.compile(r"\d+\.\d{2}")
+HDFC_RE_OPENING_BALANCE = re.compile(r"opening\s*balance.*?([\d,]+\.\d{2})", re.IGNORECASE)
+HDFC_RE_STATEMENT_SUMMARY = re.compile(r"(?i)statement\s*summary.*")
+HDFC_RE_GENERATED_ON = re.compile(r"(?i)generated\s*on.*")
+HDFC_REF_PREFIXES = ("MIR", "IMPS", "UTR", "RRN", "IBKL", "UPI", "POS", "HDFCN", "UBIN")
+# Word kinds returned by hdfc_classify(), combinable as bit flags
+HDFC_KIND_DATE = 1
+HDFC_KIND_AMOUNT = 2
+HDFC_KIND_REF = 4
+# Blocklist words as one alternation, searched in the lowercased token
+HDFC_REF_BLOCK_RE = re.compile("|".join(re.escape(word) for word in HDFC_REF_BLOCKLIST))
+# Every junk phrase contains one of these literals within a single word; lines without any
+# of them are not junk and skip the regex. Keep in step with HDFC_JUNK_PHRASES
+HDFC_JUNK_HINTS = (":", "page", "hdfc", "statement", "generated", "registered")
+# All junk phrases fused into one alternation: one scan per line instead of one per phrase
+HDFC_JUNK_RE = re.compile("|".join(f"(?:{p})" for p in HDFC_JUNK_PHRASES), re.IGNORECASE)
+
 # --- Kotak Bank Regex ---
-KOTAK_RE_MERGED_SL_DATE = re.compile(r"^(\d+)\s+(\d{2}/\d{2}/\d{4})")
+# Serial number, date and the rest of a merged cell, captured in one match
+KOTAK_RE_MERGED_SL_DATE = re.compile(r"^(\d+)\s+(\d{2}/\d{2}/\d{4})(.*)", re.DOTALL)
 KOTAK_RE_DATE = re.compile(r'\d{2}/\d{2}/\d{4}')
 KOTAK_RE_AMOUNT = re.compile(r'^-?[\d,]+\.\d{2}$')
 KOTAK_RE_DR_CR = re.compile(r'^(DR|CR)$', re.IGNORECASE)
+KOTAK_REF_PREFIXES = ("UPI-", "IMPS-", "NEFT-", "RTGS-", "MB-")
+KOTAK_RE_GARBAGE = re.compile(r"(Page\s+\d+|Account\s+Statement|Opening\s+Balance)", re.IGNORECASE)
 
 # --- Axis & YesBank Patterns ---
 AXIS_DATE_PATTERN = re.compile(r'(\d{2}/\d{2}/\d{4}|\d{1,2}-\w+-\d{2})')
 AXIS_AMOUNT_PATTERN = re.compile(r'[\d,]+\.?\d*')
 YESBANK_DATE_PATTERN = re.compile(r'(\d{2}/\d{2}/\d{4}|\d{1,2}-\w+-\d{2})')
 YESBANK_AMOUNT_PATTERN = re.compile(r'[\d,]+\.?\d*')
+# Header rows: both keyword groups present, in either order
+AXIS_HEADER_RE = re.compile(r'^(?=.*(?:date|transaction))(?=.*amount)', re.IGNORECASE | re.DOTALL)
+YESBANK_HEADER_RE = re.compile(r'^(?=.*(?:date|transaction))(?=.*(?:amount|balance))', re.IGNORECASE | re.DOTALL)
+
+# --- Table Extraction ---
+# Column/row detection from text alignment
+TEXT_TABLE_SETTINGS = {
+    "vertical_strategy": "text",
+    "horizontal_strategy": "text",
+    "snap_tolerance": 3
+}
+# Ruled statements: cells come straight from the drawn grid instead of character clustering
+LINES_TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+}
+
+# --- Parallel Page Processing ---
+# Documents with more pages than this are split across a process pool. A page takes
+# 0.07-0.16 s to parse; a forked pool adds 0.02-0.17 s, so it pays off from a few pages
+PARALLEL_PAGE_THRESHOLD = 6
+# Spawned workers (the default on Windows and macOS) start a fresh interpreter and
+# re-import this module, about 0.15-0.75 s each, so only long statements are worth it
+SPAWN_PARALLEL_PAGE_THRESHOLD = 24
 
 
 
@@ -65,128 +140,364 @@ YESBANK_AMOUNT_PATTERN = re.compile(r'[\d,]+\.?\d*')
 # BANK DETECTION LOGIC
 # ==========================================
 
-def detect_bank(pdf_path):
+def detect_bank_from_text(first_page_text):
     """
     Detects the bank type based on specific keywords and headers in the first page.
     Follows a strict priority order to avoid false positives.
     
     Args:
-        pdf_path (str): Path to the PDF file
+        first_page_text (str): Extracted text of the first page of the PDF
         
     Returns:
         str: Bank identifier (KOTAK, JK, HDFC, AXIS, YESBANK, or STANDARD)
     """
-    try:
-        with pdfplumber.open(pdf_path) as pdf:
-            if not pdf.pages:
-                logger.warning("PDF has no pages, using STANDARD parser")
-                return "STANDARD"
-            first_page_text = pdf.pages[0].extract_text() or ""
-            text_lower = first_page_text.lower()
+    text_lower = first_page_text.lower()
+    text_nospace = None
+
+    def nospace():
+        # Whitespace-stripped copy, built only if a plain-text check fails first
+        nonlocal text_nospace
+        if text_nospace is None:
             text_nospace = text_lower.replace(" ", "").replace("\n", "")
+        return text_nospace
 
-            # --- PRIORITY 1: UNIQUE KOTAK IDENTIFIERS ---
-            if "cust. reln. no." in text_lower or "kotak mahindra bank" in text_lower or "kkbk" in text_nospace:
-                logger.info("Detected bank: KOTAK")
-                return "KOTAK"
-            
-            # --- PRIORITY 2: J&K BANK ---
-            if "jammu" in text_lower and "kashmir" in text_lower:
-                logger.info("Detected bank: J&K")
-                return "JK"
-            
-            # --- PRIORITY 3: HDFC BANK (Strict Mode) ---
-            if "hdfc bank" in text_lower or "proc-dl-statement" in text_lower or "hdfcbank" in text_nospace:
-                logger.info("Detected bank: HDFC")
-                return "HDFC"
-            
-            # --- PRIORITY 4: AXIS BANK ---
-            if "axis bank" in text_lower or "axisbank" in text_nospace:
-                logger.info("Detected bank: AXIS")
-                return "AXIS"
-            
-            # --- PRIORITY 5: YES BANK ---
-            if "yes bank" in text_lower or "yesbank" in text_nospace:
-                logger.info("Detected bank: YESBANK")
-                return "YESBANK"
-            
-            logger.info("No specific bank detected, using STANDARD parser")
-            return "STANDARD"
+    # --- PRIORITY 1: UNIQUE KOTAK IDENTIFIERS ---
+    if "cust. reln. no." in text_lower or "kotak mahindra bank" in text_lower or "kkbk" in nospace():
+        logger.info("Detected bank: KOTAK")
+        return "KOTAK"
+    
+    # --- PRIORITY 2: J&K BANK ---
+    if "jammu" in text_lower and "kashmir" in text_lower:
+        logger.info("Detected bank: J&K")
+        return "JK"
+    
+    # --- PRIORITY 3: HDFC BANK (Strict Mode) ---
+    if "hdfc bank" in text_lower or "proc-dl-statement" in text_lower or "hdfcbank" in nospace():
+        logger.info("Detected bank: HDFC")
+        return "HDFC"
+    
+    # --- PRIORITY 4: AXIS BANK ---
+    if "axis bank" in text_lower or "axisbank" in nospace():
+        logger.info("Detected bank: AXIS")
+        return "AXIS"
+    
+    # --- PRIORITY 5: YES BANK ---
+    if "yes bank" in text_lower or "yesbank" in nospace():
+        logger.info("Detected bank: YESBANK")
+        return "YESBANK"
+    
+    logger.info("No specific bank detected, using STANDARD parser")
+    return "STANDARD"
+
+
+# Document-info string values (/Title (...), /Producer (...), ...) in the raw PDF bytes
+_PDF_INFO_VALUE_RE = re.compile(rb'/(?:Title|Author|Subject|Keywords|Creator|Producer)\s*\(((?:\\.|[^\\)])*)\)')
+
+
+def _fast_detect_from_bytes(pdf_path, head_size=65536):
+    """
+    Detects the bank from the document-info metadata in the first bytes of the file,
+    without parsing the PDF. Only the metadata values are searched: page content may be
+    uncompressed and mention other banks in transaction narrations.
+
+    Args:
+        pdf_path (str): Path to the PDF file
+        head_size (int): Number of leading bytes to scan
+
+    Returns:
+        str or None: Bank identifier, or None if the metadata names no known bank
+    """
+    try:
+        with open(pdf_path, 'rb') as f:
+            head = f.read(head_size)
+    except (OSError, TypeError):
+        return None
+
+    info = b" ".join(_PDF_INFO_VALUE_RE.findall(head)).lower()
+    if not info:
+        return None
+
+    # Same priority order as detect_bank_from_text()
+    if info.find(b"kotak mahindra") != -1 or info.find(b"kkbk") != -1:
+        bank = "KOTAK"
+    elif info.find(b"jammu") != -1 and info.find(b"kashmir") != -1:
+        bank = "JK"
+    elif info.find(b"hdfc bank") != -1 or info.find(b"hdfcbank") != -1:
+        bank = "HDFC"
+    elif info.find(b"axis bank") != -1 or info.find(b"axisbank") != -1:
+        bank = "AXIS"
+    elif info.find(b"yes bank") != -1 or info.find(b"yesbank") != -1:
+        bank = "YESBANK"
+    else:
+        return None
+
+    logger.info(f"Detected bank from PDF metadata: {bank}")
+    return bank
+
+
+def detect_bank(pdf):
+    """
+    Detects the bank of an open PDF: from the document metadata when it names the bank,
+    otherwise from the first page text.
+    
+    Args:
+        pdf: Open pdfplumber PDF
+        
+    Returns:
+        tuple: (bank identifier, first page text or None if it was not extracted)
+    """
+    bank = _fast_detect_from_bytes(_pdf_source_path(pdf))
+    if bank is not None:
+        return bank, None
+    if not pdf.pages:
+        logger.warning("PDF has no pages, using STANDARD parser")
+        return "STANDARD", None
+    try:
+        first_page_text = pdf.pages[0].extract_text() or ""
+        return detect_bank_from_text(first_page_text), first_page_text
     except Exception as e:
         logger.error(f"Error in bank detection: {e}")
-        return "STANDARD"
+        return "STANDARD", None
+
+
+# ==========================================
+# PAGE PROCESSING HELPERS
+# ==========================================
+
+def _pdf_source_path(pdf):
+    """Returns the file path an open pdfplumber PDF was loaded from, or None for in-memory streams."""
+    path = getattr(pdf, "path", None) or getattr(pdf.stream, "name", None)
+    return str(path) if path else None
+
+
+def _is_ddmmyyyy(s):
+    """Cheap DD/MM/YYYY prefix check for the per-line loops; rejects most lines after one comparison."""
+    return (len(s) >= 10 and s[2] == '/' and s[5] == '/'
+            and s[0:2].isdecimal() and s[3:5].isdecimal() and s[6:10].isdecimal())
+
+
+def _page_text(page, first_page_text=None):
+    """Returns page.extract_text(), reusing the first page text already extracted for bank detection."""
+    if first_page_text is not None and page.page_number == 1:
+        return first_page_text
+    return page.extract_text()
+
+
+def _import_pymupdf():
+    """
+    Imports PyMuPDF (MuPDF, written in C), which extracts positioned words far faster than
+    pdfplumber. Only the opt-in HDFC word path needs it, so it is loaded on first use.
+    Returns None when it is not installed.
+    """
+    try:
+        import pymupdf
+    except ImportError:
+        try:
+            import fitz as pymupdf  # PyMuPDF releases before 1.24.3
+        except ImportError:
+            return None
+    if hasattr(pymupdf, "no_recommend_layout"):
+        # Newer releases print an advisory to stdout, where the CLI reports its transaction count
+        pymupdf.no_recommend_layout()
+    return pymupdf
+
+
+def _apply_page_worker(worker, pdf, page_indices, pymupdf_path=None):
+    """Runs the worker over the given pages, passing the matching PyMuPDF page when a path is given."""
+    if pymupdf_path is None:
+        return [worker(pdf.pages[idx]) for idx in page_indices]
+    with _import_pymupdf().open(pymupdf_path) as doc:
+        return [worker(pdf.pages[idx], doc[idx]) for idx in page_indices]
+
+
+def _run_page_worker(args):
+    """Process pool entry point: reopens the PDF and applies the worker to a run of pages."""
+    worker, pdf_path, page_indices, use_pymupdf = args
+    with pdfplumber.open(pdf_path) as pdf:
+        return _apply_page_worker(worker, pdf, page_indices, pdf_path if use_pymupdf else None)
+
+
+def _pool_start_method():
+    """Returns the start method a new pool will use, without fixing the process-wide default."""
+    return multiprocessing.get_start_method(allow_none=True) or multiprocessing.get_all_start_methods()[0]
+
+
+def _map_pages(pdf, worker, use_pymupdf=False):
+    """
+    Applies worker(page) to every page of an open PDF and returns the results in page order.
+    Page layout analysis is CPU-bound, so larger documents (see PARALLEL_PAGE_THRESHOLD and
+    SPAWN_PARALLEL_PAGE_THRESHOLD) are split into contiguous page runs processed by a
+    ProcessPoolExecutor. pdfplumber objects cannot be pickled, hence each pool process
+    reopens the file from its path.
+    
+    Args:
+        pdf: Open pdfplumber PDF
+        worker: Module-level function taking a pdfplumber page
+        use_pymupdf (bool): Also pass the PyMuPDF page, as worker(page, pymupdf_page), when
+            PyMuPDF is installed and the PDF was opened from a file
+        
+    Returns:
+        list: One worker result per page
+    """
+    num_pages = len(pdf.pages)
+    pdf_path = _pdf_source_path(pdf)
+    num_workers = min(os.cpu_count() or 1, num_pages)
+    use_pymupdf = bool(use_pymupdf and pdf_path and _import_pymupdf() is not None)
+
+    threshold = PARALLEL_PAGE_THRESHOLD if _pool_start_method() == "fork" else SPAWN_PARALLEL_PAGE_THRESHOLD
+
+    # Pool workers are daemonic and may not spawn their own pools
+    if (num_pages <= threshold or num_workers < 2 or not pdf_path
+            or multiprocessing.current_process().daemon):
+        return _apply_page_worker(worker, pdf, range(num_pages), pdf_path if use_pymupdf else None)
+
+    run_length = -(-num_pages // num_workers)
+    jobs = [(worker, pdf_path, range(start, min(start + run_length, num_pages)), use_pymupdf)
+            for start in range(0, num_pages, run_length)]
+    logger.debug(f"Processing {num_pages} pages across {len(jobs)} processes")
+
+    results = []
+    with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        for page_results in executor.map(_run_page_worker, jobs):
+            results.extend(page_results)
+    return results
+
+
+# ==========================================
+# TRANSACTION RECORDS
+# ==========================================
+
+class Txn:
+    """
+    Slotted transaction row used while a parser accumulates results; much smaller than a
+    dict per row. Subclasses declare their output fields in JSON key order in __slots__.
+    Description is collected as a list of fragments and joined once by as_dict().
+    """
+    __slots__ = ()
+    BANK = ""
+
+    def as_dict(self):
+        txn = {field: getattr(self, field) for field in self.__slots__}
+        txn["Description"] = " ".join(self.Description)
+        txn["Bank"] = self.BANK
+        return txn
+
+
+class AxisTxn(Txn):
+    __slots__ = ("Date", "Description", "Amount", "Balance")
+    BANK = "AXIS"
+
+    def __init__(self, date="", description=None):
+        self.Date = date
+        self.Description = [] if description is None else [description]
+        self.Amount = "0.00"
+        self.Balance = "0.00"
+
+
+class YesBankTxn(Txn):
+    __slots__ = ("Date", "Description", "Debit", "Credit", "Balance")
+    BANK = "YESBANK"
+
+    def __init__(self, date="", description=None):
+        self.Date = date
+        self.Description = [] if description is None else [description]
+        self.Debit = "0.00"
+        self.Credit = "0.00"
+        self.Balance = "0.00"
+
+
+class JKTxn(Txn):
+    __slots__ = ("Date", "Description", "Ref_No", "Debit", "Credit", "Balance", "Cheque")
+    BANK = "J&K"
+
+    def __init__(self, date, description, ref_no, debit, credit, balance, cheque):
+        self.Date = date
+        self.Description = [description]
+        self.Ref_No = ref_no
+        self.Debit = debit
+        self.Credit = credit
+        self.Balance = balance
+        self.Cheque = cheque
 
 
 # ==========================================
 # AXIS BANK PARSER (Table + Text)
 # ==========================================
 
-def parse_axis_statement(pdf_path):
+def parse_axis_statement(pdf, first_page_text=None):
     transactions = []
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                tables = page.extract_tables(table_settings={
-                    "vertical_strategy": "text",
-                    "horizontal_strategy": "text",
-                    "snap_tolerance": 3
-                })
-
-                if not tables:
-                    text = page.extract_text()
-                    if text:
-                        transactions.extend(_parse_axis_text(text))
-                    continue
-
-                for table in tables:
-                    if not table:
-                        continue
-                    header_idx = -1
-                    for i, row in enumerate(table):
-                        row_text = " ".join([str(c) for c in row if c]).lower()
-                        if ("date" in row_text or "transaction" in row_text) and "amount" in row_text:
-                            header_idx = i
-                            break
-                    if header_idx == -1 and len(table) > 0:
-                        header_idx = 0
-                    start_row = header_idx + 1 if header_idx != -1 else 0
-                    for row in table[start_row:]:
-                        row = [str(c).strip() if c else "" for c in row]
-                        if not any(row) or len(row) < 2:
-                            continue
-                        txn = {"Date": "", "Description": "", "Amount": "0.00", "Balance": "0.00", "Bank": "AXIS"}
-                        for i, cell in enumerate(row):
-                            if i == 0 and AXIS_DATE_PATTERN.match(cell):
-                                txn["Date"] = cell
-                            elif i == len(row) - 1 and AXIS_AMOUNT_PATTERN.match(cell):
-                                txn["Balance"] = cell
-                            elif i == len(row) - 2 and AXIS_AMOUNT_PATTERN.match(cell):
-                                txn["Amount"] = cell
-                            else:
-                                txn["Description"] = (txn["Description"] + " " + cell).strip() if cell else txn["Description"]
-                        if txn["Date"]:
-                            transactions.append(txn)
+        for page_transactions in _map_pages(pdf, partial(_parse_axis_page, first_page_text=first_page_text)):
+            transactions.extend(page_transactions)
     except Exception as e:
         print(f"Axis parser error: {e}", file=sys.stderr)
+    return [txn.as_dict() for txn in transactions]
+
+
+def _parse_axis_page(page, first_page_text=None):
+    # Every transaction row starts with a date; pages without one (cover, summary,
+    # terms) cannot yield rows, so skip the costly table detection on them
+    text = _page_text(page, first_page_text)
+    if not text or not AXIS_DATE_PATTERN.search(text):
+        return []
+
+    tables = page.extract_tables(table_settings=TEXT_TABLE_SETTINGS)
+
+    if not tables:
+        return _parse_axis_text(text)
+
+    transactions = []
+    for table in tables:
+        if not table:
+            continue
+        header_idx = -1
+        for i, row in enumerate(table):
+            if AXIS_HEADER_RE.search(" ".join([str(c) for c in row if c])):
+                header_idx = i
+                break
+        if header_idx == -1 and len(table) > 0:
+            header_idx = 0
+        start_row = header_idx + 1 if header_idx != -1 else 0
+        for row in table[start_row:]:
+            row = [str(c).strip() if c else "" for c in row]
+            if not any(row) or len(row) < 2:
+                continue
+            # Only rows whose first cell is a date become transactions
+            if not AXIS_DATE_PATTERN.match(row[0]):
+                continue
+            txn = AxisTxn(row[0])
+            last = len(row) - 1
+            txn.Description.extend(cell for cell in row[1:last - 1] if cell)
+            if last >= 2:
+                cell = row[last - 1]
+                if AXIS_AMOUNT_PATTERN.match(cell):
+                    txn.Amount = cell
+                elif cell:
+                    txn.Description.append(cell)
+            cell = row[last]
+            if AXIS_AMOUNT_PATTERN.match(cell):
+                txn.Balance = cell
+            elif cell:
+                txn.Description.append(cell)
+            transactions.append(txn)
     return transactions
 
 
 def _parse_axis_text(text):
     transactions = []
     lines = text.split('\n')
-    date_pattern = re.compile(r'^(\d{2}/\d{2}/\d{4})')
     current_txn = None
     for line in lines:
         line = line.strip()
         if not line:
             continue
-        if date_pattern.match(line):
+        if _is_ddmmyyyy(line):
             if current_txn:
                 transactions.append(current_txn)
             parts = line.split()
-            current_txn = {"Date": parts[0] if parts else "", "Description": " ".join(parts[1:]) if len(parts) > 1 else "", "Amount": "0.00", "Balance": "0.00", "Bank": "AXIS"}
+            current_txn = AxisTxn(parts[0] if parts else "", " ".join(parts[1:]) if len(parts) > 1 else "")
         elif current_txn:
-            current_txn["Description"] += " " + line
+            current_txn.Description.append(line)
     if current_txn:
         transactions.append(current_txn)
     return transactions
@@ -196,68 +507,73 @@ def _parse_axis_text(text):
 # YESBANK PARSER (Table + Text)
 # ==========================================
 
-def parse_yesbank_statement(pdf_path):
+def parse_yesbank_statement(pdf, first_page_text=None):
     transactions = []
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                tables = page.extract_tables(table_settings={
-                    "vertical_strategy": "text",
-                    "horizontal_strategy": "text",
-                    "snap_tolerance": 3
-                })
-                if not tables:
-                    text = page.extract_text()
-                    if text:
-                        transactions.extend(_parse_yesbank_text(text))
-                    continue
-                for table in tables:
-                    if not table:
-                        continue
-                    header_idx = -1
-                    for i, row in enumerate(table):
-                        row_text = " ".join([str(c) for c in row if c]).lower()
-                        if ("date" in row_text or "transaction" in row_text) and ("amount" in row_text or "balance" in row_text):
-                            header_idx = i
-                            break
-                    if header_idx == -1 and len(table) > 0:
-                        header_idx = 0
-                    start_row = header_idx + 1 if header_idx != -1 else 0
-                    for row in table[start_row:]:
-                        row = [str(c).strip() if c else "" for c in row]
-                        if not any(row) or len(row) < 2:
-                            continue
-                        txn = {"Date": "", "Description": "", "Debit": "0.00", "Credit": "0.00", "Balance": "0.00", "Bank": "YESBANK"}
-                        for i, cell in enumerate(row):
-                            if i == 0 and YESBANK_DATE_PATTERN.match(cell):
-                                txn["Date"] = cell
-                            elif i == len(row) - 1 and YESBANK_AMOUNT_PATTERN.match(cell):
-                                txn["Balance"] = cell
-                            else:
-                                txn["Description"] = (txn["Description"] + " " + cell).strip() if cell else txn["Description"]
-                        if txn["Date"]:
-                            transactions.append(txn)
+        for page_transactions in _map_pages(pdf, partial(_parse_yesbank_page, first_page_text=first_page_text)):
+            transactions.extend(page_transactions)
     except Exception as e:
         print(f"YesBank parser error: {e}", file=sys.stderr)
+    return [txn.as_dict() for txn in transactions]
+
+
+def _parse_yesbank_page(page, first_page_text=None):
+    # Every transaction row starts with a date; pages without one (cover, summary,
+    # terms) cannot yield rows, so skip the costly table detection on them
+    text = _page_text(page, first_page_text)
+    if not text or not YESBANK_DATE_PATTERN.search(text):
+        return []
+
+    tables = page.extract_tables(table_settings=TEXT_TABLE_SETTINGS)
+    if not tables:
+        return _parse_yesbank_text(text)
+
+    transactions = []
+    for table in tables:
+        if not table:
+            continue
+        header_idx = -1
+        for i, row in enumerate(table):
+            if YESBANK_HEADER_RE.search(" ".join([str(c) for c in row if c])):
+                header_idx = i
+                break
+        if header_idx == -1 and len(table) > 0:
+            header_idx = 0
+        start_row = header_idx + 1 if header_idx != -1 else 0
+        for row in table[start_row:]:
+            row = [str(c).strip() if c else "" for c in row]
+            if not any(row) or len(row) < 2:
+                continue
+            # Only rows whose first cell is a date become transactions
+            if not YESBANK_DATE_PATTERN.match(row[0]):
+                continue
+            txn = YesBankTxn(row[0])
+            last = len(row) - 1
+            txn.Description.extend(cell for cell in row[1:last] if cell)
+            cell = row[last]
+            if YESBANK_AMOUNT_PATTERN.match(cell):
+                txn.Balance = cell
+            elif cell:
+                txn.Description.append(cell)
+            transactions.append(txn)
     return transactions
 
 
 def _parse_yesbank_text(text):
     transactions = []
     lines = text.split('\n')
-    date_pattern = re.compile(r'^(\d{2}/\d{2}/\d{4})')
     current_txn = None
     for line in lines:
         line = line.strip()
         if not line:
             continue
-        if date_pattern.match(line):
+        if _is_ddmmyyyy(line):
             if current_txn:
                 transactions.append(current_txn)
             parts = line.split()
-            current_txn = {"Date": parts[0] if parts else "", "Description": " ".join(parts[1:]) if len(parts) > 1 else "", "Debit": "0.00", "Credit": "0.00", "Balance": "0.00", "Bank": "YESBANK"}
+            current_txn = YesBankTxn(parts[0] if parts else "", " ".join(parts[1:]) if len(parts) > 1 else "")
         elif current_txn:
-            current_txn["Description"] += " " + line
+            current_txn.Description.append(line)
     if current_txn:
         transactions.append(current_txn)
     return transactions
@@ -267,91 +583,92 @@ def _parse_yesbank_text(text):
 # J&K BANK PARSER (Regex Based)
 # ==========================================
 
-def parse_with_regex_jk(pdf):
-    transactions = []
-    
-    date_pattern = re.compile(r'^(\d{2}/\d{2}/\d{4})')
-    amount_pattern = re.compile(r'^-?[\d,]+(\.\d+)?$')
-    cheque_pattern = re.compile(r'^\d{6}$')
+def _extract_jk_page_text(page):
+    return page.extract_text(x_tolerance=2, y_tolerance=5)
+
 
+def _scan_jk_lines(lines):
+    """
+    Turns J&K statement lines (all pages, in document order) into JKTxn rows.
+    jk_lines.pyx is a compiled copy of this scanner; keep the two in step.
+    """
+    transactions = []
     pending_next_description = ""
 
-    for page in pdf.pages:
-        text = page.extract_text(x_tolerance=2, y_tolerance=5)
-        if not text:
+    for line in lines:
+        line = line.strip()
+        if not line:
             continue
 
-        lines = text.split('\n')
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        # Skip header lines; a plain loop over the tuple avoids any()'s generator
+        skip = False
+        for marker in JK_SKIP_MARKERS:
+            if marker in line:
+                skip = True
+                break
+        if skip:
+            continue
 
-            # Skip header lines
-            if any(x in line for x in ["Value Date", "Account Balance", "Page", "Balance Carried"]):
+        # Check if line starts with a date (New Transaction)
+        if _is_ddmmyyyy(line):
+            parts = line.split()
+            if len(parts) < 3:
                 continue
 
-            # Check if line starts with a date (New Transaction)
-            if date_pattern.match(line):
-                parts = line.split()
-                if len(parts) < 3:
-                    continue
+            val_date = parts[0]
+            txn_date = parts[1] if _is_ddmmyyyy(parts[1]) else ""
 
-                val_date = parts[0]
-                txn_date = parts[1] if re.match(r'\d{2}/\d{2}/\d{4}', parts[1]) else ""
+            # Remove dates to process remaining text
+            remaining = line.replace(val_date, "", 1).replace(txn_date, "", 1).strip()
+            rem_parts = remaining.split()
 
-                # Remove dates to process remaining text
-                remaining = line.replace(val_date, "", 1).replace(txn_date, "", 1).strip()
-                rem_parts = remaining.split()
+            cheque_no, ref_no = "", ""
+            balance, deposit, withdrawal = "0.0", "0.0", "0.0"
 
-                cheque_no, ref_no = "", ""
-                balance, deposit, withdrawal = "0.0", "0.0", "0.0"
+            # Extract Cheque Number if present
+            if rem_parts:
+                if JK_CHEQUE_RE.match(rem_parts[0]):
+                    cheque_no = rem_parts.pop(0)
+                elif rem_parts[0] == "-":
+                    rem_parts.pop(0)
 
-                # Extract Cheque Number if present
-                if rem_parts:
-                    if cheque_pattern.match(rem_parts[0]):
-                        cheque_no = rem_parts.pop(0)
-                    elif rem_parts[0] == "-":
-                        rem_parts.pop(0)
+            # Extract numeric values from the end of the line
+            if rem_parts: ref_no = rem_parts.pop()
+            if rem_parts and JK_AMOUNT_RE.match(rem_parts[-1]): balance = rem_parts.pop()
+            if rem_parts and JK_AMOUNT_RE.match(rem_parts[-1]): deposit = rem_parts.pop()
+            if rem_parts and JK_AMOUNT_RE.match(rem_parts[-1]): withdrawal = rem_parts.pop()
 
-                # Extract numeric values from the end of the line
-                if rem_parts: ref_no = rem_parts.pop()
-                if rem_parts and amount_pattern.match(rem_parts[-1]): balance = rem_parts.pop()
-                if rem_parts and amount_pattern.match(rem_parts[-1]): deposit = rem_parts.pop()
-                if rem_parts and amount_pattern.match(rem_parts[-1]): withdrawal = rem_parts.pop()
+            current_desc = " ".join(rem_parts)
+            
+            # Append any pending description from previous lines
+            if pending_next_description:
+                current_desc = pending_next_description + " " + current_desc
+                pending_next_description = ""
 
-                current_desc = " ".join(rem_parts)
-                
-                # Append any pending description from previous lines
-                if pending_next_description:
-                    current_desc = pending_next_description + " " + current_desc
-                    pending_next_description = ""
-
-                txn = {
-                    "Date": val_date,
-                    "Description": current_desc,
-                    "Ref_No": ref_no,
-                    "Debit": withdrawal,
-                    "Credit": deposit,
-                    "Balance": balance,
-                    "Cheque": cheque_no,
-                    "Bank": "J&K"
-                }
-                transactions.append(txn)
+            transactions.append(JKTxn(val_date, current_desc, ref_no, withdrawal, deposit, balance, cheque_no))
 
+        else:
+            # Handle multi-line descriptions
+            if JK_START_RE.match(line):
+                pending_next_description = (pending_next_description + " " + line).strip()
             else:
-                # Handle multi-line descriptions
-                is_start_keyword = any(line.upper().startswith(kw.upper()) for kw in JK_START_KEYWORDS)
-                if is_start_keyword:
-                    pending_next_description = (pending_next_description + " " + line).strip()
-                else:
-                    if transactions:
-                        transactions[-1]["Description"] += " " + line
+                if transactions:
+                    transactions[-1].Description.append(line)
 
     return transactions
 
 
+def parse_with_regex_jk(pdf):
+    # Text extraction runs per page (in parallel for long statements); the line scan
+    # stays sequential because descriptions carry over between pages
+    lines = [line for text in _map_pages(pdf, _extract_jk_page_text) if text for line in text.split('\n')]
+
+    if jk_lines is not None:
+        rows = jk_lines.scan_jk_lines(lines, JK_START_KEYWORDS, JK_SKIP_MARKERS)
+        return [JKTxn(*row).as_dict() for row in rows]
+    return [txn.as_dict() for txn in _scan_jk_lines(lines)]
+
+
 # ==========================================
 # STANDARD PARSER (Simple Table)
 # ==========================================
@@ -382,175 +699,298 @@ def parse_with_simple_table(pdf):
     return transactions
 
 
+def parse_standard_statement(pdf):
+    """
+    STANDARD parser (explicit or fallback): simple tables first, then the J&K-style regex
+    parser for text-only statements.
+    """
+    data = parse_with_simple_table(pdf)
+    if not data:
+        logger.info("Standard parser found no transactions, trying J&K regex parser")
+        data = parse_with_regex_jk(pdf)
+    return data
+
+
 # ==========================================
 # HDFC BANK PARSER (Coordinate Based)
 # ==========================================
 
 # --- HDFC Helper Functions ---
-def hdfc_is_date(t): 
-    return bool(re.fullmatch(r"\d{2}/\d{2}/\d{2}", t))
-
-def hdfc_is_amount(t): 
-    return bool(re.search(r"\d{1,3}(?:,\d{3})*\.\d{2}", t))
-
 def hdfc_clean_amount(t):
     t = t.replace(",", "")
-    m = re.search(r"\d+\.\d{2}", t)
+    # Plain "1234.56" (the usual amount cell) converts directly; anything else is searched
+    point = len(t) - 3
+    if point > 0 and t[point] == "." and t[:point].isdecimal() and t[point + 1:].isdecimal():
+        return float(t)
+    m = HDFC_RE_AMOUNT_SIMPLE.search(t)
     return float(m.group()) if m else None
 
-def hdfc_is_ref(t): 
-    return bool(re.fullmatch(r"\d{10,}", t)) or bool(re.match(r"(MIR|IMPS|UTR|RRN|IBKL|UPI|POS|HDFCN|UBIN)", t))
+def hdfc_classify(t):
+    """
+    Classifies a word in one pass with C-level string checks, returning a bitmask of
+    HDFC_KIND_DATE / HDFC_KIND_AMOUNT / HDFC_KIND_REF. Each flag agrees exactly with the
+    regex it replaces (checked in test_hdfc.py).
+    """
+    kind = 0
+    # \d{2}/\d{2}/\d{2}
+    if len(t) == 8 and t[2] == "/" and t[5] == "/" and t[:2].isdecimal() and t[3:5].isdecimal() and t[6:].isdecimal():
+        return HDFC_KIND_DATE
+    # Searching \d{1,3}(?:,\d{3})*\.\d{2} succeeds exactly when some "." has a digit
+    # before it and two digits after it
+    dot = t.find(".", 1)
+    while dot != -1:
+        if t[dot - 1].isdecimal() and len(t[dot + 1:dot + 3]) == 2 and t[dot + 1:dot + 3].isdecimal():
+            kind = HDFC_KIND_AMOUNT
+            break
+        dot = t.find(".", dot + 1)
+    if (len(t) >= 10 and t.isdecimal()) or t.startswith(HDFC_REF_PREFIXES):
+        kind |= HDFC_KIND_REF
+    return kind
 
 def hdfc_is_junk_text(text):
     t_lower = text.lower()
-    for pattern in HDFC_JUNK_PHRASES:
-        if re.search(pattern, t_lower): return True
+    for hint in HDFC_JUNK_HINTS:
+        if hint in t_lower:
+            return HDFC_JUNK_RE.search(text) is not None
     return False
 
 def hdfc_is_valid_ref_part(text):
-    t_lower = text.lower()
-    for bad_word in HDFC_REF_BLOCKLIST:
-        if bad_word in t_lower: return False
-    if text.isalpha() and not text.isupper(): return False
-    return True
+    if HDFC_REF_BLOCK_RE.search(text.lower()): return False
+    return text.isupper() or not text.isalpha()
 
-def hdfc_get_column_boundaries(page):
+def hdfc_boundaries_from_words(words):
     """
-    Dynamically determines column boundaries for HDFC statements based on text coordinates.
+    Column boundaries from already extracted words, each carrying its hdfc_classify()
+    result under 'kind'. Lets the parser reuse one extract_words() pass per page.
     """
-    words = page.extract_words()
-    date_end_xs = [w['x1'] for w in words if hdfc_is_date(w['text']) and w['x0'] < 100]
+    if np is not None and words:
+        return _hdfc_boundaries_numpy(words)
+
+    date_end_xs = [w['x1'] for w in words if w['kind'] & HDFC_KIND_DATE and w['x0'] < 100]
     narration_min_x = max(date_end_xs) + 2 if date_end_xs else 80
 
     ref_start_xs = []
     for w in words:
         if w['x0'] > 250:
-            if hdfc_is_ref(w['text']): ref_start_xs.append(w['x0'])
+            if w['kind'] & HDFC_KIND_REF: ref_start_xs.append(w['x0'])
     ref_min_x = min(ref_start_xs) - 2 if ref_start_xs else 330
     narration_max_x = ref_min_x
 
     ref_end_xs = []
     for w in words:
         if w['x0'] > ref_min_x + 20:
-            if (hdfc_is_date(w['text']) and w['x0'] > 300) or hdfc_is_amount(w['text']):
+            if (w['kind'] & HDFC_KIND_DATE and w['x0'] > 300) or w['kind'] & HDFC_KIND_AMOUNT:
                 ref_end_xs.append(w['x0'])
     ref_max_x = min(ref_end_xs) - 2 if ref_end_xs else 420
     
     return narration_min_x, narration_max_x, ref_min_x, ref_max_x
 
-def parse_hdfc_statement(path):
+def hdfc_group_rows(words):
+    """
+    Groups words into rows by rounded top coordinate, returning the rows top to bottom
+    with each row's words ordered left to right (ties keep extraction order).
+    """
+    if np is None or not words:
+        lines = {}
+        for w in words:
+            lines.setdefault(round(w["top"]), []).append(w)
+        return [sorted(row, key=lambda w: w["x0"]) for _, row in sorted(lines.items())]
+
+    # np.round and round() both round half to even; lexsort is stable like sorted()
+    count = len(words)
+    row_keys = np.round(np.fromiter((w["top"] for w in words), dtype=np.float64, count=count))
+    x0s = np.fromiter((w["x0"] for w in words), dtype=np.float64, count=count)
+    order = np.lexsort((x0s, row_keys))
+    sorted_keys = row_keys[order]
+    row_starts = (np.flatnonzero(sorted_keys[1:] != sorted_keys[:-1]) + 1).tolist()
+    order = order.tolist()
+    return [[words[i] for i in order[start:end]]
+            for start, end in zip([0] + row_starts, row_starts + [count])]
+
+def _parse_hdfc_page(page, pymupdf_page=None):
+    """
+    Parses one HDFC page into an ordered list of events for parse_hdfc_statement():
+    ("open", balance) for the page's first opening-balance line, ("txn", tx, amt_objs)
+    for each transaction row and ("cont", narration, ref) for each continuation row.
+    Everything that depends on earlier pages (running balance, which transaction a
+    continuation belongs to) is left to the sequential replay.
+    """
+    # One word extraction per page serves both column detection and row grouping;
+    # each word is classified once and carries its kind from here on
+    if pymupdf_page is not None:
+        # (x0, y0, x1, y1, text, block_no, line_no, word_no); line_no restarts in every
+        # block, so rows are still grouped by rounded top. y0 is the font's ascender line
+        # rather than pdfplumber's top, so words set in different fonts on one line can
+        # round into different rows; this path is therefore opt-in (pymupdf_words)
+        words = [{"text": w[4], "x0": w[0], "x1": w[2], "top": w[1]}
+                 for w in pymupdf_page.get_text("words")]
+    else:
+        words = page.extract_words(use_text_flow=True)
+    for w in words:
+        w["kind"] = hdfc_classify(w["text"])
+    narration_min, narration_max, ref_min, ref_max = hdfc_boundaries_from_words(words)
+
+    events = []
+    opening_balance_found = False
+    # Local aliases for the per-word loops
+    is_valid_ref_part = hdfc_is_valid_ref_part
+    clean_amount = hdfc_clean_amount
+    kind_date, kind_amount = HDFC_KIND_DATE, HDFC_KIND_AMOUNT
+    kind_date_or_amount = HDFC_KIND_DATE | HDFC_KIND_AMOUNT
+    # Only the first page is known to have no earlier transactions to continue
+    txns_seen = page.page_number != 1
+
+    # Group words by Y-coordinate (rows)
+    for row in hdfc_group_rows(words):
+        first = row[0]
+        starts_txn = first["kind"] & kind_date and first['x0'] < 100
+
+        # Rows before the first transaction only matter for the opening balance; once
+        # that is known they are skipped without joining their text
+        if opening_balance_found and not starts_txn and not txns_seen: continue
+        line_text = " ".join(w["text"] for w in row)
+
+        # Capture opening balance
+        if not opening_balance_found and "opening balance" in line_text.lower():
+            m = HDFC_RE_OPENING_BALANCE.search(line_text)
+            if m:
+                events.append(("open", hdfc_clean_amount(m.group(1))))
+                opening_balance_found = True
+
+        if hdfc_is_junk_text(line_text): continue
+
+        # New Transaction Detection
+        if starts_txn:
+            tx = {
+                "Date": first["text"], "Narration": "", "Value_Date": "", "Ref_No": "",
+                "Withdrawal": 0.0, "Deposit": 0.0, "Closing_Balance": 0.0, "Bank": "HDFC"
+            }
+            narration_words = []
+            ref_words = []
+            amt_objs = []
+
+            # One pass bins every word into narration, reference, value date and amounts
+            for w in row:
+                t = w["text"]; x = w["x0"]; kind = w["kind"]
+                if narration_min <= x <= narration_max:
+                    narration_words.append(t)
+                elif ref_min <= x <= ref_max:
+                    if not kind & kind_date_or_amount:
+                        if is_valid_ref_part(t): ref_words.append(t)
+                elif x > ref_max:
+                    if kind & kind_date and not tx["Value_Date"]: tx["Value_Date"] = t
+                # Checked on its own: the narration range can reach past ref_max when
+                # the reference column was found but its right edge was not
+                if kind & kind_amount and x > ref_max:
+                    amt_objs.append((clean_amount(t), x))
+
+            tx["Narration"] = " ".join(narration_words)
+            tx["Ref_No"] = "".join(ref_words)
+            events.append(("txn", tx, amt_objs))
+            txns_seen = True
+
+        # Continuation of the previous transaction (Multi-line)
+        else:
+            extra_narr = []
+            extra_ref = []
+            for w in row:
+                # Date and amount words never extend a narration or reference
+                if w["kind"] & kind_date_or_amount: continue
+                x = w["x0"]
+                if narration_min <= x <= narration_max:
+                    extra_narr.append(w["text"])
+                elif ref_min <= x <= ref_max:
+                    t = w["text"]
+                    if is_valid_ref_part(t): extra_ref.append(t)
+            line_content = " ".join(extra_narr)
+            if line_content and hdfc_is_junk_text(line_content): line_content = ""
+            if line_content or extra_ref:
+                events.append(("cont", line_content, "".join(extra_ref)))
+    return events
+
+def _hdfc_boundaries_numpy(words):
+    """hdfc_boundaries_from_words() as vectorized masks over the word coordinates."""
+    count = len(words)
+    x0 = np.fromiter((w['x0'] for w in words), dtype=np.float64, count=count)
+    x1 = np.fromiter((w['x1'] for w in words), dtype=np.float64, count=count)
+    kinds = np.fromiter((w['kind'] for w in words), dtype=np.int8, count=count)
+    is_date = (kinds & HDFC_KIND_DATE) != 0
+
+    date_end_xs = x1[is_date & (x0 < 100)]
+    narration_min_x = float(date_end_xs.max()) + 2 if date_end_xs.size else 80
+
+    ref_start_xs = x0[((kinds & HDFC_KIND_REF) != 0) & (x0 > 250)]
+    ref_min_x = float(ref_start_xs.min()) - 2 if ref_start_xs.size else 330
+    narration_max_x = ref_min_x
+
+    ref_end_xs = x0[(x0 > ref_min_x + 20) & ((is_date & (x0 > 300)) | ((kinds & HDFC_KIND_AMOUNT) != 0))]
+    ref_max_x = float(ref_end_xs.min()) - 2 if ref_end_xs.size else 420
+
+    return narration_min_x, narration_max_x, ref_min_x, ref_max_x
+
+def parse_hdfc_statement(pdf, pymupdf_words=False):
+    if pymupdf_words and _import_pymupdf() is None:
+        logger.warning("PyMuPDF is not installed, reading HDFC words with pdfplumber")
     txns = []
     opening_balance = 0.0
     opening_balance_found = False
 
-    with pdfplumber.open(path) as pdf:
-        for page in pdf.pages:
-            narration_min, narration_max, ref_min, ref_max = hdfc_get_column_boundaries(page)
-            words = page.extract_words(use_text_flow=True)
-            
-            # Group words by Y-coordinate (rows)
-            lines = {}
-            for w in words: 
-                lines.setdefault(round(w["top"]), []).append(w)
-
-            sorted_lines = sorted(lines.items())
-
-            for y, row in sorted_lines:
-                row = sorted(row, key=lambda w: w["x0"])
-                if not row: continue
-                first = row[0]
-                line_text = " ".join(w["text"] for w in row)
-
-                # Capture opening balance
-                if not opening_balance_found and "opening balance" in line_text.lower():
-                    m = re.search(r"opening\s*balance.*?([\d,]+\.\d{2})", line_text, re.IGNORECASE)
-                    if m:
-                        opening_balance = hdfc_clean_amount(m.group(1))
-                        opening_balance_found = True
-
-                if hdfc_is_junk_text(line_text): continue
-
-                # New Transaction Detection
-                if hdfc_is_date(first["text"]) and first['x0'] < 100:
-                    tx = {
-                        "Date": first["text"], "Narration": "", "Value_Date": "", "Ref_No": "",
-                        "Withdrawal": 0.0, "Deposit": 0.0, "Closing_Balance": 0.0, "Bank": "HDFC"
-                    }
-                    narration_words = []
-                    ref_words = []
-
-                    for w in row:
-                        t = w["text"]; x = w["x0"]
-                        if narration_min <= x <= narration_max:
-                            narration_words.append(t)
-                        elif ref_min <= x <= ref_max:
-                            if not hdfc_is_date(t) and not hdfc_is_amount(t):
-                                if hdfc_is_valid_ref_part(t): ref_words.append(t)
-                        elif x > ref_max:
-                            if hdfc_is_date(t) and not tx["Value_Date"]: tx["Value_Date"] = t
-
-                    tx["Narration"] = " ".join(narration_words)
-                    tx["Ref_No"] = "".join(ref_words)
-
-                    # Determine Amounts (Withdrawal vs Deposit) based on balance logic
-                    amt_objs = [(hdfc_clean_amount(w["text"]), w["x0"]) for w in row if hdfc_is_amount(w["text"]) and w['x0'] > ref_max]
-
-                    if amt_objs:
-                        tx["Closing_Balance"] = amt_objs[-1][0]
-                        balance_x = amt_objs[-1][1]
-
-                        if len(amt_objs) >= 2:
-                            txn_amt = amt_objs[0][0]
-                            txn_x = amt_objs[0][1]
-
-                            prev_bal = txns[-1]["Closing_Balance"] if txns else opening_balance
-
-                            if txns or opening_balance_found:
-                                if tx["Closing_Balance"] < prev_bal:
-                                    tx["Withdrawal"] = txn_amt
-                                elif tx["Closing_Balance"] > prev_bal:
-                                    tx["Deposit"] = txn_amt
-                                else:
-                                    # Fallback to coordinate distance if math doesn't help
-                                    if (balance_x - txn_x) > 100: tx["Withdrawal"] = txn_amt
-                                    else: tx["Deposit"] = txn_amt
+    # Pages are parsed independently (in parallel for longer statements) and their
+    # events replayed here in page order
+    for events in _map_pages(pdf, _parse_hdfc_page, use_pymupdf=pymupdf_words):
+        for event in events:
+            if event[0] == "open":
+                if not opening_balance_found:
+                    opening_balance = event[1]
+                    opening_balance_found = True
+
+            elif event[0] == "txn":
+                _, tx, amt_objs = event
+
+                # Determine Amounts (Withdrawal vs Deposit) based on balance logic
+                if amt_objs:
+                    tx["Closing_Balance"] = amt_objs[-1][0]
+                    balance_x = amt_objs[-1][1]
+
+                    if len(amt_objs) >= 2:
+                        txn_amt = amt_objs[0][0]
+                        txn_x = amt_objs[0][1]
+
+                        prev_bal = txns[-1]["Closing_Balance"] if txns else opening_balance
+
+                        if txns or opening_balance_found:
+                            if tx["Closing_Balance"] < prev_bal:
+                                tx["Withdrawal"] = txn_amt
+                            elif tx["Closing_Balance"] > prev_bal:
+                                tx["Deposit"] = txn_amt
+                            else:
+                                # Fallback to coordinate distance if math doesn't help
+                                if (balance_x - txn_x) > 100: tx["Withdrawal"] = txn_amt
+                                else: tx["Deposit"] = txn_amt
+                        else:
+                            dist = balance_x - txn_x
+                            if dist > 110:
+                                tx["Withdrawal"] = txn_amt
                             else:
-                                dist = balance_x - txn_x
-                                if dist > 110:
-                                    tx["Withdrawal"] = txn_amt
-                                else:
-                                    tx["Deposit"] = txn_amt
-
-                        elif len(amt_objs) == 3:
-                            tx["Withdrawal"] = amt_objs[0][0]
-                            tx["Deposit"] = amt_objs[1][0]
-
-                    txns.append(tx)
-
-                # Append to previous transaction (Multi-line)
-                elif txns:
-                    if hdfc_is_junk_text(line_text): continue
-                    extra_narr = []
-                    extra_ref = []
-                    for w in row:
-                        if narration_min <= w["x0"] <= narration_max:
-                            if not hdfc_is_amount(w["text"]) and not hdfc_is_date(w["text"]):
-                                extra_narr.append(w["text"])
-                        elif ref_min <= w["x0"] <= ref_max:
-                            if not hdfc_is_amount(w["text"]) and not hdfc_is_date(w["text"]):
-                                if hdfc_is_valid_ref_part(w["text"]):
-                                    extra_ref.append(w["text"])
-                    if extra_narr:
-                        line_content = " ".join(extra_narr)
-                        if not hdfc_is_junk_text(line_content):
-                            txns[-1]["Narration"] += " " + line_content
-                    if extra_ref: txns[-1]["Ref_No"] += "".join(extra_ref)
+                                tx["Deposit"] = txn_amt
+
+                    elif len(amt_objs) == 3:
+                        tx["Withdrawal"] = amt_objs[0][0]
+                        tx["Deposit"] = amt_objs[1][0]
+
+                txns.append(tx)
+
+            # Append to previous transaction (Multi-line)
+            elif txns:
+                _, line_content, extra_ref = event
+                if line_content: txns[-1]["Narration"] += " " + line_content
+                if extra_ref: txns[-1]["Ref_No"] += extra_ref
 
     # Final Cleanup
     for t in txns:
         t["Narration"] = t["Narration"].strip()
-        t["Narration"] = re.sub(r"(?i)statement\s*summary.*", "", t["Narration"])
-        t["Narration"] = re.sub(r"(?i)generated\s*on.*", "", t["Narration"])
+        t["Narration"] = HDFC_RE_STATEMENT_SUMMARY.sub("", t["Narration"])
+        t["Narration"] = HDFC_RE_GENERATED_ON.sub("", t["Narration"])
         t["Ref_No"] = t["Ref_No"].replace(" ", "").strip()
     return txns
 
@@ -561,7 +1001,9 @@ def parse_hdfc_statement(path):
 
 # --- Kotak Helper Functions ---
 def kotak_is_date(text): 
-    return bool(KOTAK_RE_DATE.search(str(text)))
+    # A date needs a '/', so most cells are rejected before the regex runs
+    text = str(text)
+    return "/" in text and KOTAK_RE_DATE.search(text) is not None
 
 def kotak_is_amount(text):
     clean_text = str(text).replace(" ", "").replace(",", "")
@@ -577,74 +1019,119 @@ def kotak_repair_merged_columns(row):
     if not row or not row[0]: return row
     match = KOTAK_RE_MERGED_SL_DATE.match(str(row[0]).strip())
     if match:
-        sl_no, date_str = match.groups()
-        remaining = str(row[0])[match.end():].strip()
+        sl_no, date_str, remaining = match.groups()
+        remaining = remaining.strip()
         new_row = [sl_no, date_str]
         if remaining: new_row.append(remaining)
         new_row.extend(row[1:])
         return new_row
     return row
 
-def parse_kotak_statement(pdf_path):
+def _kotak_lines_tables_cover_dates(page, found):
+    """
+    True if every dated word on the page lies inside one of the lines-strategy tables.
+    A ruled box around, say, the statement period must not stand in for the whole page.
+    """
+    bboxes = [t.bbox for t in found]
+    for w in page.extract_words():
+        if not kotak_is_date(w["text"]): continue
+        cx = (w["x0"] + w["x1"]) / 2
+        cy = (w["top"] + w["bottom"]) / 2
+        if not any(x0 <= cx <= x1 and top <= cy <= bottom for x0, top, x1, bottom in bboxes):
+            return False
+    return True
+
+def _parse_kotak_page(page):
+    """
+    Parses one Kotak page. Returns (leading_continuations, transactions): description
+    lines found before the page's first transaction belong to the previous page's last
+    transaction and are left for parse_kotak_statement() to attach.
+
+    Pages with ruling lines are read with the cheap lines strategy first. Its tables are
+    kept only if they cover every dated word on the page and yield a transaction with an
+    amount or balance; otherwise (and for unruled pages) the text strategy clusters
+    characters into columns as before.
+    """
+    if page.edges:
+        found = page.find_tables(table_settings=LINES_TABLE_SETTINGS)
+        if found and _kotak_lines_tables_cover_dates(page, found):
+            leading, transactions = _parse_kotak_tables([t.extract() for t in found])
+            if any(tx["Amount"] != "0.00" or tx["Balance"] != "0.00" for tx in transactions):
+                return leading, transactions
+    return _parse_kotak_tables(page.extract_tables(table_settings=TEXT_TABLE_SETTINGS))
+
+def _parse_kotak_tables(tables):
+    """Parses the extracted tables of one Kotak page; see _parse_kotak_page()."""
+    leading = []
     transactions = []
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            tables = page.extract_tables(table_settings={"vertical_strategy": "text", "horizontal_strategy": "text", "snap_tolerance": 3})
-            for table in tables:
-                if not table: continue
+    for table in tables:
+        if not table: continue
+        
+        # Identify Header Row
+        header_idx = -1
+        for i, row in enumerate(table):
+            row_text = " ".join([str(c) for c in row if c]).lower()
+            if "date" in row_text and "balance" in row_text:
+                header_idx = i
+                break
+        start_row = header_idx + 1 if header_idx != -1 else 0
+
+        for raw_row in table[start_row:]:
+            cleaned_row = [str(c).strip().replace('\n', ' ') if c else "" for c in raw_row]
+            row = kotak_repair_merged_columns(cleaned_row)
+            
+            # Find Date Column Index
+            date_idx = -1
+            for idx, cell in enumerate(row):
+                if kotak_is_date(cell):
+                    date_idx = idx
+                    break
+            
+            if date_idx != -1:
+                sl_no = row[date_idx-1] if date_idx > 0 else ""
+                date_val = row[date_idx]
+                tx = {
+                    "Sl. No.": sl_no, "Date": date_val, "Description": "", "Chq/Ref number": "",
+                    "Amount": "0.00", "Dr/Cr": "", "Balance": "0.00", "Balance_Dr/Cr": "", "Bank": "KOTAK"
+                }
+                
+                remaining = [c for c in row[date_idx+1:] if c.strip()]
+                if remaining and kotak_is_dr_cr(remaining[-1]): tx["Balance_Dr/Cr"] = remaining.pop()
+                if remaining and kotak_is_amount(remaining[-1]): tx["Balance"] = remaining.pop()
+                if remaining and kotak_is_dr_cr(remaining[-1]): tx["Dr/Cr"] = remaining.pop()
+                if remaining and kotak_is_amount(remaining[-1]): tx["Amount"] = remaining.pop()
                 
-                # Identify Header Row
-                header_idx = -1
-                for i, row in enumerate(table):
-                    row_text = " ".join([str(c) for c in row if c]).lower()
-                    if "date" in row_text and "balance" in row_text:
-                        header_idx = i
-                        break
-                start_row = header_idx + 1 if header_idx != -1 else 0
-
-                for raw_row in table[start_row:]:
-                    cleaned_row = [str(c).strip().replace('\n', ' ') if c else "" for c in raw_row]
-                    row = kotak_repair_merged_columns(cleaned_row)
-                    
-                    # Find Date Column Index
-                    date_idx = -1
-                    for idx, cell in enumerate(row):
-                        if kotak_is_date(cell):
-                            date_idx = idx
-                            break
-                    
-                    if date_idx != -1:
-                        sl_no = row[date_idx-1] if date_idx > 0 else ""
-                        date_val = row[date_idx]
-                        tx = {
-                            "Sl. No.": sl_no, "Date": date_val, "Description": "", "Chq/Ref number": "",
-                            "Amount": "0.00", "Dr/Cr": "", "Balance": "0.00", "Balance_Dr/Cr": "", "Bank": "KOTAK"
-                        }
-                        
-                        remaining = [c for c in row[date_idx+1:] if c.strip()]
-                        if remaining and kotak_is_dr_cr(remaining[-1]): tx["Balance_Dr/Cr"] = remaining.pop()
-                        if remaining and kotak_is_amount(remaining[-1]): tx["Balance"] = remaining.pop()
-                        if remaining and kotak_is_dr_cr(remaining[-1]): tx["Dr/Cr"] = remaining.pop()
-                        if remaining and kotak_is_amount(remaining[-1]): tx["Amount"] = remaining.pop()
-                        
-                        ref_candidates = []
-                        desc_parts = []
-                        for item in remaining:
-                            if re.match(r'^(UPI|IMPS|NEFT|RTGS|MB)-', item) or (item.isdigit() and len(item)>6):
-                                ref_candidates.append(item)
-                            else: 
-                                desc_parts.append(item)
-                        
-                        tx["Description"] = " ".join(desc_parts)
-                        tx["Chq/Ref number"] = " ".join(ref_candidates)
-                        transactions.append(tx)
-
-                    elif transactions and len(row) > 0:
-                        # Append multiline description
-                        extra_text = " ".join([c for c in row if c.strip()])
-                        is_garbage = re.search(r"(Page\s+\d+|Account\s+Statement|Opening\s+Balance)", extra_text, re.IGNORECASE)
-                        if extra_text and not is_garbage: 
-                            transactions[-1]["Description"] += " " + extra_text
+                ref_candidates = []
+                desc_parts = []
+                for item in remaining:
+                    if item.startswith(KOTAK_REF_PREFIXES) or (len(item) > 6 and item.isdigit()):
+                        ref_candidates.append(item)
+                    else: 
+                        desc_parts.append(item)
+                
+                tx["Description"] = " ".join(desc_parts)
+                tx["Chq/Ref number"] = " ".join(ref_candidates)
+                transactions.append(tx)
+
+            elif len(row) > 0:
+                # Append multiline description
+                extra_text = " ".join([c for c in row if c.strip()])
+                is_garbage = KOTAK_RE_GARBAGE.search(extra_text)
+                if extra_text and not is_garbage:
+                    if transactions:
+                        transactions[-1]["Description"] += " " + extra_text
+                    else:
+                        leading.append(extra_text)
+    return leading, transactions
+
+def parse_kotak_statement(pdf):
+    transactions = []
+    # Pages are parsed independently (in parallel for longer statements)
+    for leading, page_transactions in _map_pages(pdf, _parse_kotak_page):
+        if transactions:
+            for extra_text in leading:
+                transactions[-1]["Description"] += " " + extra_text
+        transactions.extend(page_transactions)
 
     # Final Cleanup
     for t in transactions:
@@ -661,7 +1148,42 @@ def parse_kotak_statement(pdf_path):
 # MAIN EXECUTION BLOCK
 # ==========================================
 
-def parse_pdf(pdf_path, out_json, mode='auto'):
+# Transactions serialized per orjson call when streaming the output file
+JSON_WRITE_BATCH = 1000
+
+
+def _write_json(data, out_json, compact=False):
+    """
+    Writes transactions as 2-space indented UTF-8 JSON, or without whitespace when compact
+    is set, using orjson when available. Both encoders produce the same layout, so
+    consumers see identical files, and both stream: orjson encodes JSON_WRITE_BATCH
+    transactions at a time and json.dump writes chunk by chunk, so the whole document
+    is never held in memory.
+    """
+    if orjson is not None:
+        option = 0 if compact else orjson.OPT_INDENT_2
+        # Strip each batch's own brackets: "[" "]" compact, "[\n" "\n]" indented
+        trim = 1 if compact else 2
+        separator = b"," if compact else b",\n"
+        with open(out_json, 'wb') as f:
+            if not data:
+                f.write(b"[]")
+                return
+            f.write(b"[" if compact else b"[\n")
+            for start in range(0, len(data), JSON_WRITE_BATCH):
+                if start:
+                    f.write(separator)
+                f.write(orjson.dumps(data[start:start + JSON_WRITE_BATCH], option=option)[trim:-trim])
+            f.write(b"]" if compact else b"\n]")
+    else:
+        with open(out_json, 'w', encoding='utf-8') as f:
+            if compact:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            else:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def parse_pdf(pdf_path, out_json, mode='auto', compact=False, pymupdf_words=False):
     """
     Main parser function that routes to appropriate parser based on bank type or mode.
     
@@ -669,49 +1191,39 @@ def parse_pdf(pdf_path, out_json, mode='auto'):
         pdf_path (str): Path to the PDF file
         out_json (str): Output JSON file path
         mode (str): Parser mode ('auto', 'standard', 'AXIS', 'YESBANK', 'HDFC', 'KOTAK', 'JK')
+        compact (bool): Write JSON without indentation (smaller, faster to write)
+        pymupdf_words (bool): Read HDFC words with PyMuPDF (much faster; rows can differ
+            from pdfplumber's when a line mixes fonts)
         
     Returns:
         int: 0 on success, 1 on failure
     """
     data = []
     try:
-        if mode == 'standard':
-            logger.info("Using STANDARD parser")
-            with pdfplumber.open(pdf_path) as pdf:
-                data = parse_with_simple_table(pdf)
-                if not data:
-                    logger.info("Standard parser found no transactions, trying J&K regex parser")
-                    data = parse_with_regex_jk(pdf)
-        else:
-            bank = detect_bank(pdf_path) if mode == 'auto' else mode.upper()
-            logger.info(f"Using {bank} parser")
-            
-            if bank == 'AXIS':
-                data = parse_axis_statement(pdf_path)
-            elif bank == 'YESBANK':
-                data = parse_yesbank_statement(pdf_path)
-            elif bank == 'HDFC':
-                data = parse_hdfc_statement(pdf_path)
-            elif bank == 'KOTAK':
-                data = parse_kotak_statement(pdf_path)
-            elif bank == 'JK':
-                with pdfplumber.open(pdf_path) as pdf:
-                    data = parse_with_regex_jk(pdf)
+        # Open the PDF once and hand the same handle to detection and the parsers
+        with pdfplumber.open(pdf_path) as pdf:
+            if mode == 'auto':
+                bank, first_page_text = detect_bank(pdf)
             else:
-                logger.info("Using fallback STANDARD parser")
-                with pdfplumber.open(pdf_path) as pdf:
-                    data = parse_with_simple_table(pdf)
-                    if not data:
-                        logger.info("Standard parser found no transactions, trying J&K regex parser")
-                        data = parse_with_regex_jk(pdf)
+                bank, first_page_text = mode.upper(), None
+            logger.info(f"Using {bank} parser")
+
+            # Axis and YesBank reuse the first page text already read for detection
+            parsers = {
+                'AXIS': partial(parse_axis_statement, first_page_text=first_page_text),
+                'YESBANK': partial(parse_yesbank_statement, first_page_text=first_page_text),
+                'HDFC': partial(parse_hdfc_statement, pymupdf_words=pymupdf_words),
+                'KOTAK': parse_kotak_statement,
+                'JK': parse_with_regex_jk,
+            }
+            data = parsers.get(bank, parse_standard_statement)(pdf)
     except Exception as e:
         logger.error(f"Parse error: {e}", exc_info=True)
         data = []
 
     if data:
         try:
-            with open(out_json, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_json(data, out_json, compact)
             logger.info(f"Successfully written {len(data)} transactions to {out_json}")
             print(f"transactions:{len(data)}")
             return 0
@@ -725,21 +1237,109 @@ def parse_pdf(pdf_path, out_json, mode='auto'):
         return 1
 
 
+def _init_batch_worker(log_level):
+    """Pool initializer: carries the parent's log level into spawned worker processes."""
+    logger.setLevel(log_level)
+
+
+def parse_batch(pairs, mode='auto', workers=None, compact=False, pymupdf_words=False):
+    """
+    Parses many PDFs in one run, fanning files out across a multiprocessing pool so the
+    interpreter and pdfplumber are loaded once per worker instead of once per file.
+    Pool workers are daemonic, so each file is parsed page-by-page inside its worker.
+    
+    Args:
+        pairs (list): (pdf_path, out_json) tuples
+        mode (str): Parser mode applied to every file (see parse_pdf)
+        workers (int): Number of worker processes (default: CPU count)
+        compact (bool): Write JSON without indentation (see parse_pdf)
+        pymupdf_words (bool): Read HDFC words with PyMuPDF (see parse_pdf)
+        
+    Returns:
+        list: parse_pdf return code for each pair, in input order
+    """
+    pairs = list(pairs)
+    jobs = [(pdf_path, out_json, mode, compact, pymupdf_words) for pdf_path, out_json in pairs]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+
+    if workers < 2:
+        return [parse_pdf(*job) for job in jobs]
+
+    logger.info(f"Parsing {len(jobs)} PDFs across {workers} processes")
+    with multiprocessing.Pool(workers, initializer=_init_batch_worker, initargs=(logger.level,)) as pool:
+        return pool.starmap(parse_pdf, jobs, chunksize=1)
+
+
+def read_batch_file(batch_path):
+    """
+    Reads a batch file with one "pdf_path out_json" pair per line. The two paths are
+    separated by a tab, or by spaces with any path containing spaces put in quotes.
+    Backslashes are kept as written, so Windows paths need no escaping. Blank lines and
+    lines starting with '#' are ignored.
+    
+    Args:
+        batch_path (str): Path to the batch file
+        
+    Returns:
+        list: (pdf_path, out_json) tuples
+        
+    Raises:
+        ValueError: If a line does not contain exactly two paths
+    """
+    pairs = []
+    with open(batch_path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if '\t' in line:
+                fields = [field.strip() for field in line.split('\t')]
+            else:
+                # Non-POSIX splitting leaves backslashes alone but keeps the quotes
+                fields = [field[1:-1] if len(field) > 1 and field[0] == field[-1] and field[0] in '"\'' else field
+                          for field in shlex.split(line, posix=False)]
+            if len(fields) != 2:
+                raise ValueError(f"{batch_path}:{line_no}: expected 'pdf_path out_json', got {line!r}")
+            pairs.append((fields[0], fields[1]))
+    return pairs
+
+
 def main():
     """Main entry point for the PDF parser."""
     parser = argparse.ArgumentParser(
         description='Multi-Bank PDF Statement Parser - Automatic bank detection and transaction extraction',
-        epilog='Examples:\n  python main_parser.py statement.pdf output.json\n  python main_parser.py statement.pdf output.json --mode AXIS',
+        epilog='Examples:\n  python main_parser.py statement.pdf output.json\n  python main_parser.py statement.pdf output.json --mode AXIS\n  python main_parser.py --batch jobs.txt',
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
-    parser.add_argument('pdf_path', help='Path to the PDF file to parse')
-    parser.add_argument('out_json', help='Output JSON file path')
+    parser.add_argument('pdf_path', nargs='?', help='Path to the PDF file to parse')
+    parser.add_argument('out_json', nargs='?', help='Output JSON file path')
+    parser.add_argument(
+        '--batch',
+        metavar='FILE',
+        help='Parse every "pdf_path out_json" pair listed in FILE (one per line) using a process pool'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of worker processes for --batch (default: CPU count)'
+    )
     parser.add_argument(
         '--mode', 
         choices=['auto', 'standard', 'AXIS', 'YESBANK', 'HDFC', 'KOTAK', 'JK'], 
         default='auto',
         help='Parsing mode (default: auto detection)'
     )
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Write compact JSON without indentation'
+    )
+    parser.add_argument(
+        '--pymupdf-words',
+        action='store_true',
+        help='Read HDFC words with PyMuPDF (faster; requires PyMuPDF)'
+    )
     parser.add_argument(
         '--verbose', 
         action='store_true',
@@ -753,6 +1353,31 @@ def main():
     
     logger.info(f"Starting PDF parser - Mode: {args.mode}")
     
+    if args.batch:
+        if args.pdf_path or args.out_json:
+            parser.error("pdf_path/out_json cannot be combined with --batch")
+        try:
+            pairs = read_batch_file(args.batch)
+        except (OSError, ValueError) as e:
+            logger.error(f"Cannot read batch file: {e}")
+            print(f"Error: cannot read batch file: {e}", file=sys.stderr)
+            sys.exit(1)
+        if not pairs:
+            logger.error(f"Batch file lists no PDFs: {args.batch}")
+            sys.exit(1)
+        
+        rcs = parse_batch(pairs, mode=args.mode, workers=args.workers, compact=args.compact,
+                          pymupdf_words=args.pymupdf_words)
+        failed = [pdf_path for (pdf_path, _), rc in zip(pairs, rcs) if rc != 0]
+        for pdf_path in failed:
+            logger.warning(f"No transactions written for {pdf_path}")
+        rc = 1 if failed else 0
+        logger.info(f"Batch finished: {len(pairs) - len(failed)}/{len(pairs)} PDFs parsed, return code: {rc}")
+        sys.exit(rc)
+    
+    if not args.pdf_path or not args.out_json:
+        parser.error("pdf_path and out_json are required unless --batch is given")
+    
     if not os.path.exists(args.pdf_path):
         logger.error(f"PDF file not found: {args.pdf_path}")
         print(f"Error: PDF file not found: {args.pdf_path}", file=sys.stderr)
@@ -761,7 +1386,8 @@ def main():
     if not args.pdf_path.lower().endswith('.pdf'):
         logger.warning(f"Input file does not have .pdf extension: {args.pdf_path}")
     
-    rc = parse_pdf(args.pdf_path, args.out_json, mode=args.mode)
+    rc = parse_pdf(args.pdf_path, args.out_json, mode=args.mode, compact=args.compact,
+                   pymupdf_words=args.pymupdf_words)
     logger.info(f"Parser finished with return code: {rc}")
     sys.exit(rc)
 
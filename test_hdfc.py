@@ -0,0 +1,108 @@
+"""
+Checks for the HDFC parser: hdfc_classify() against the regexes it replaced, and the
+PyMuPDF word path against pdfplumber's on a small single-font statement written with
+PyMuPDF (skipped when PyMuPDF is not installed).
+
+Run with: python -m unittest test_hdfc
+"""
+
+import os
+import random
+import re
+import tempfile
+import unittest
+
+import pdfplumber
+
+import main_parser
+
+
+pymupdf = main_parser._import_pymupdf()
+
+# The word checks hdfc_classify() replaced, as originally written
+RE_DATE = re.compile(r"\d{2}/\d{2}/\d{2}")
+RE_AMOUNT = re.compile(r"\d{1,3}(?:,\d{3})*\.\d{2}")
+RE_REF_NUM = re.compile(r"\d{10,}")
+RE_REF_PREFIX = re.compile(r"(MIR|IMPS|UTR|RRN|IBKL|UPI|POS|HDFCN|UBIN)")
+
+# Characters the checks care about, plus a non-ASCII digit that \d and isdecimal() accept
+TOKEN_CHARS = "00112233445566778899..,,//-MIUPa ٣"
+TOKEN_PREFIXES = [""] * 10 + ["MIR", "IMPS", "UTR", "RRN", "IBKL", "UPI", "POS", "HDFCN", "UBIN", "UP"]
+
+
+def write_hdfc_statement(path, pages=2):
+    """Writes a text-only HDFC-style statement (Helvetica 7pt) to path."""
+    rng = random.Random(7)
+    doc = pymupdf.open()
+    balance = 50000.00
+    for p in range(pages):
+        page = doc.new_page(width=595, height=842)
+
+        def text(x, y, s):
+            page.insert_text((x, y), s, fontsize=7, fontname="helv")
+
+        y = 40
+        if p == 0:
+            text(40, y, "HDFC BANK Ltd  Statement of account"); y += 12
+            text(40, y, f"Opening Balance {balance:,.2f}"); y += 12
+        text(40, y, "Date"); text(90, y, "Narration"); text(340, y, "Chq./Ref.No.")
+        text(420, y, "Value Dt"); text(470, y, "Withdrawal Amt."); y += 12
+        for i in range(30):
+            date = f"{i % 28 + 1:02d}/{p % 12 + 1:02d}/24"
+            amount = rng.randint(100, 9999) + rng.randint(0, 99) / 100
+            deposit = rng.random() < 0.4
+            balance = balance + amount if deposit else balance - amount
+            text(40, y, date)
+            text(90, y, rng.choice(["UPI-JOHN DOE-OKAXIS", "NEFT CR-ICIC0000-ACME", "POS 1234 STORE"]))
+            text(340, y, rng.choice(["0000412345678901", "IMPS12345", "UTRN998877"]))
+            text(420, y, date)
+            text(510 if deposit else 460, y, f"{amount:,.2f}")
+            text(555, y, f"{balance:,.2f}")
+            y += 11
+            if i % 4 == 0:
+                text(90, y, "MORE NARRATION"); text(340, y, "ABC12"); y += 11
+    doc.save(path)
+    doc.close()
+
+
+def regex_kind(t):
+    if RE_DATE.fullmatch(t):
+        return main_parser.HDFC_KIND_DATE
+    kind = main_parser.HDFC_KIND_AMOUNT if RE_AMOUNT.search(t) else 0
+    if RE_REF_NUM.fullmatch(t) or RE_REF_PREFIX.match(t):
+        kind |= main_parser.HDFC_KIND_REF
+    return kind
+
+
+class HDFCClassifyTest(unittest.TestCase):
+
+    def test_known_words(self):
+        for word in ["01/02/24", "1/02/24", "01/02/2a", "01.02.24", "01/02/2024", "٣٣/٣٣/٣٣",
+                     "1,234.56", "12.5", ".56", "Rs.1.00x", "0000412345678901", "123456789",
+                     "IMPS12345", "UPI-1.00", "UBI", ""]:
+            self.assertEqual(main_parser.hdfc_classify(word), regex_kind(word), word)
+
+    def test_random_words(self):
+        rng = random.Random(3)
+        for _ in range(50000):
+            word = rng.choice(TOKEN_PREFIXES) + "".join(
+                rng.choice(TOKEN_CHARS) for _ in range(rng.randint(0, 12)))
+            self.assertEqual(main_parser.hdfc_classify(word), regex_kind(word), word)
+
+
+@unittest.skipIf(pymupdf is None, "PyMuPDF not installed")
+class PyMuPDFWordsTest(unittest.TestCase):
+
+    def test_same_transactions_as_pdfplumber(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "hdfc.pdf")
+            write_hdfc_statement(path)
+            with pdfplumber.open(path) as pdf:
+                expected = main_parser.parse_hdfc_statement(pdf)
+                actual = main_parser.parse_hdfc_statement(pdf, pymupdf_words=True)
+        self.assertEqual(len(expected), 60)
+        self.assertEqual(actual, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
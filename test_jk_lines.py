@@ -0,0 +1,64 @@
+"""
+Parity check between the compiled J&K scanner (jk_lines.pyx) and the pure-Python
+_scan_jk_lines() it copies. Skipped unless the extension has been built
+(cythonize -i jk_lines.pyx).
+
+Run with: python -m unittest test_jk_lines
+"""
+
+import random
+import unittest
+
+import main_parser
+
+
+# Fragments that hit every branch of the scanner: dates (valid and malformed), cheque
+# numbers, amounts, start keywords in mixed case and header markers
+TOKENS = [
+    "01/02/2024", "1/2/2024", "12/12/20", "123456", "1234567", "1,000.00", "-5.5", "5.",
+    ".5", ",", "-", "1,2,3", "12a", "0.0", "-,", "--1", "NEFT", "neft", "By Cash", "by",
+    "TRANSFER", "mTFR", "Int. Pd", "R123", "Page", "Value Date", "Account Balance",
+    "Balance Carried", "Balance", "٣٣/٣٣/٣٣٣٣",
+]
+
+
+def random_lines(rng):
+    lines = []
+    for _ in range(rng.randint(0, 25)):
+        line = " ".join(rng.choice(TOKENS) for _ in range(rng.randint(0, 8)))
+        lines.append(("  " if rng.random() < 0.2 else "") + line)
+    return lines
+
+
+@unittest.skipIf(main_parser.jk_lines is None, "jk_lines extension not built")
+class JKScannerParityTest(unittest.TestCase):
+
+    def assert_same_output(self, lines):
+        rows = main_parser.jk_lines.scan_jk_lines(
+            lines, main_parser.JK_START_KEYWORDS, main_parser.JK_SKIP_MARKERS)
+        compiled = [main_parser.JKTxn(*row).as_dict() for row in rows]
+        python = [txn.as_dict() for txn in main_parser._scan_jk_lines(lines)]
+        self.assertEqual(compiled, python, lines)
+        return python
+
+    def test_statement_lines(self):
+        transactions = self.assert_same_output([
+            "Account Balance as on 01/02/2024",
+            "Txn Date Value Date Description Cheque Withdrawal Deposit Balance",
+            "01/02/2024 01/02/2024 NEFT-ABC123 JOHN 123456 1,000.00 - 5,000.00",
+            "SALARY FOR JAN",
+            "By Cash",
+            "03/02/2024 03/02/2024 - 2,500.50 7,500.50",
+            "Page 1 of 2",
+            "Balance Carried Forward 7,500.50",
+        ])
+        self.assertEqual(len(transactions), 2)
+
+    def test_random_lines(self):
+        rng = random.Random(1)
+        for _ in range(2000):
+            self.assert_same_output(random_lines(rng))
+
+
+if __name__ == "__main__":
+    unittest.main()